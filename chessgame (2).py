@@ -35,9 +35,8 @@ Represents a chess piece.
 
 - **Attributes**:
   - `Color color`
-  - `int row, col`
 - **Abstract Method**:
-  - `boolean canMove(Board board, int destRow, int destCol)`
+  - `boolean canMove(Board board, int srcSq, int destSq)` (squares are `row * 8 + col`)
 
 ---
 
@@ -77,13 +76,14 @@ Represents a player in the game.
 
 ---
 
-### ➡️ `Move` Class
+### ➡️ `Move`
 
-Represents a move made by a player.
+Represents a move made by a player, packed into a single 16-bit `int`.
 
-- **Attributes**:
-  - `Piece piece`
-  - `int destRow, destCol`
+- **Bits**:
+  - `0-5` destination square (`row * 8 + col`)
+  - `6-11` source square
+  - `12-15` promotion flags
 
 ---
 
@@ -116,11 +116,19 @@ This is the **fastest checkmate** in chess, occurring in just two moves:
 > Qh4# (Black wins)
 """
 
-class Move:
-    def __init__(self, piece, dest_row, dest_col):
-        self.piece = piece
-        self.dest_row = dest_row
-        self.dest_col = dest_col
+# A move is a single int: bits 0-5 hold the destination square, bits 6-11 the
+# source square and bits 12-15 promotion flags (0 for none)
+def encode_move(src_sq: int, dest_sq: int, promo: int = 0) -> int:
+    return dest_sq | (src_sq << 6) | (promo << 12)
+
+def move_dest(move: int) -> int:
+    return move & 63
+
+def move_src(move: int) -> int:
+    return (move >> 6) & 63
+
+def move_promo(move: int) -> int:
+    return move >> 12
 
 from enum import Enum
 
@@ -129,204 +137,509 @@ class Color(Enum):
     BLACK = 2
 
 from abc import ABC, abstractmethod
+from typing import ClassVar, Optional, cast
 
 class Piece(ABC):
-    def __init__(self, color, row, col):
+    # Fixed attribute slots instead of a per-instance __dict__; subclasses add none.
+    # Pieces carry no position: the board's square index is passed in as src_sq
+    __slots__ = ('color',)
+
+    # Each subclass sets KIND to an int 0-5 used to index the board's bitboards
+    KIND: ClassVar[int]
+
+    def __init__(self, color: Color) -> None:
         self.color = color
-        self.row = row
-        self.col = col
 
     @abstractmethod
-    def can_move(self, board, dest_row, dest_col):
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        pass
+
+    @abstractmethod
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        # Destination squares the piece can reach, ignoring king safety
         pass
 
 class Bishop(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        row_diff = abs(dest_row - self.row)
-        col_diff = abs(dest_col - self.col)
-        return row_diff == col_diff
+    __slots__ = ()
+    KIND = 3
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return ABS_DR[src_sq][dest_sq] == ABS_DC[src_sq][dest_sq]
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        return bitboard_squares(bishop_attacks(src_sq, board.occupancy()) & ~board.occupancy(self.color))
 
 class King(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        row_diff = abs(dest_row - self.row)
-        col_diff = abs(dest_col - self.col)
-        return row_diff <= 1 and col_diff <= 1
+    __slots__ = ()
+    KIND = 0
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return bool(KING_ATTACKS[src_sq] & (1 << dest_sq))
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        return bitboard_squares(KING_ATTACKS[src_sq] & ~board.occupancy(self.color))
 
 class Knight(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        row_diff = abs(dest_row - self.row)
-        col_diff = abs(dest_col - self.col)
-        return (row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2)
+    __slots__ = ()
+    KIND = 4
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return bool(KNIGHT_ATTACKS[src_sq] & (1 << dest_sq))
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        return bitboard_squares(KNIGHT_ATTACKS[src_sq] & ~board.occupancy(self.color))
 
 class Pawn(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        row_diff = dest_row - self.row
-        col_diff = abs(dest_col - self.col)
+    __slots__ = ()
+    KIND = 5
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return bool(self._targets(board, src_sq) & (1 << dest_sq))
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        return bitboard_squares(self._targets(board, src_sq))
 
+    def _targets(self, board: "Board", src_sq: int) -> int:
+        # Pawns push straight ahead onto empty squares and only move diagonally to capture
+        occ = board.occupancy()
         if self.color == Color.WHITE:
-            return (row_diff == 1 and col_diff == 0) or \
-                   (self.row == 1 and row_diff == 2 and col_diff == 0) or \
-                   (row_diff == 1 and col_diff == 1 and board.get_piece(dest_row, dest_col) is not None)
+            pushes, attacks = WHITE_PAWN_PUSHES[src_sq], WHITE_PAWN_ATTACKS[src_sq]
+            # Anything in front of the pawn also blocks the double push behind it
+            blocked = occ & pushes
+            blocked |= blocked << 8
         else:
-            return (row_diff == -1 and col_diff == 0) or \
-                   (self.row == 6 and row_diff == -2 and col_diff == 0) or \
-                   (row_diff == -1 and col_diff == 1 and board.get_piece(dest_row, dest_col) is not None)
+            pushes, attacks = BLACK_PAWN_PUSHES[src_sq], BLACK_PAWN_ATTACKS[src_sq]
+            blocked = occ & pushes
+            blocked |= blocked >> 8
+        enemy_occ = occ & ~board.occupancy(self.color)
+        return (pushes & ~blocked) | (attacks & enemy_occ)
 
 class Queen(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        row_diff = abs(dest_row - self.row)
-        col_diff = abs(dest_col - self.col)
-        return (row_diff == col_diff) or (self.row == dest_row or self.col == dest_col)
+    __slots__ = ()
+    KIND = 1
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return ABS_DR[src_sq][dest_sq] == ABS_DC[src_sq][dest_sq] or \
+               DR[src_sq][dest_sq] == 0 or DC[src_sq][dest_sq] == 0
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        occ = board.occupancy()
+        return bitboard_squares((rook_attacks(src_sq, occ) | bishop_attacks(src_sq, occ)) & ~board.occupancy(self.color))
 
 class Rook(Piece):
-    def can_move(self, board, dest_row, dest_col):
-        return self.row == dest_row or self.col == dest_col
+    __slots__ = ()
+    KIND = 2
+
+    def can_move(self, board: "Board", src_sq: int, dest_sq: int) -> bool:
+        return DR[src_sq][dest_sq] == 0 or DC[src_sq][dest_sq] == 0
+
+    def generate_moves(self, board: "Board", src_sq: int) -> list[int]:
+        return bitboard_squares(rook_attacks(src_sq, board.occupancy()) & ~board.occupancy(self.color))
+
+# Pieces are stateless, so the board shares one instance per (type, color)
+WHITE_KING, BLACK_KING = King(Color.WHITE), King(Color.BLACK)
+WHITE_QUEEN, BLACK_QUEEN = Queen(Color.WHITE), Queen(Color.BLACK)
+WHITE_ROOK, BLACK_ROOK = Rook(Color.WHITE), Rook(Color.BLACK)
+WHITE_BISHOP, BLACK_BISHOP = Bishop(Color.WHITE), Bishop(Color.BLACK)
+WHITE_KNIGHT, BLACK_KNIGHT = Knight(Color.WHITE), Knight(Color.BLACK)
+WHITE_PAWN, BLACK_PAWN = Pawn(Color.WHITE), Pawn(Color.BLACK)
 
 class Player:
-    def __init__(self, color):
+    __slots__ = ('color',)
+
+    def __init__(self, color: Color) -> None:
         self.color = color
 
-    def make_move(self, board, move):
-        piece = move.piece
-        dest_row = move.dest_row
-        dest_col = move.dest_col
-
-        if board.is_valid_move(piece, dest_row, dest_col):
-            source_row = piece.row
-            source_col = piece.col
-            board.set_piece(source_row, source_col, None)
-            board.set_piece(dest_row, dest_col, piece)
-            piece.row = dest_row
-            piece.col = dest_col
-        else:
+    def make_move(self, board: "Board", move: int) -> None:
+        source_sq = move_src(move)
+        dest_sq = move_dest(move)
+        source_row, source_col = divmod(source_sq, 8)
+        dest_row, dest_col = divmod(dest_sq, 8)
+
+        if not board.is_valid_move(source_row, source_col, dest_row, dest_col):
             raise ValueError("Invalid move!")
 
-import copy
+        # A move may not leave the mover's own king under attack
+        undo_info = board.make_move(source_sq, dest_sq)
+        king_row, king_col = board.king_pos[self.color]
+        if board.is_in_check(self.color, king_row, king_col):
+            board.unmake_move(undo_info)
+            raise ValueError("Invalid move!")
+
+# Bitboards: bit (row * 8 + col) of a 64-bit int marks that square
+BOARD_MASK = 0xFFFFFFFFFFFFFFFF
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+NOT_FILE_A = BOARD_MASK ^ FILE_A
+NOT_FILE_H = BOARD_MASK ^ FILE_H
+
+# Directions for sliding pieces (Rook, Bishop, Queen)
+DIRECTIONS = [
+    (-1, 0),  # Up (Vertical)
+    (1, 0),   # Down (Vertical)
+    (0, -1),  # Left (Horizontal)
+    (0, 1),   # Right (Horizontal)
+    (-1, -1), # Top-left (Diagonal)
+    (-1, 1),  # Top-right (Diagonal)
+    (1, -1),  # Bottom-left (Diagonal)
+    (1, 1),   # Bottom-right (Diagonal)
+]
+ORTHOGONAL = range(0, 4)
+DIAGONAL = range(4, 8)
+# A ray "increases" when it walks towards higher square indices
+RAY_INCREASES = [dr > 0 or (dr == 0 and dc > 0) for dr, dc in DIRECTIONS]
+
+def _build_rays():
+    rays = [[0] * 64 for _ in DIRECTIONS]
+    for d, (dr, dc) in enumerate(DIRECTIONS):
+        for sq in range(64):
+            r, c = sq // 8 + dr, sq % 8 + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                rays[d][sq] |= 1 << (r * 8 + c)
+                r += dr
+                c += dc
+    return rays
+
+# RAYS[d][sq]: every square from sq (exclusive) to the edge of the board in direction d
+RAYS = _build_rays()
+
+def bitboard_squares(bb: int) -> list[int]:
+    # Square index of every set bit, lowest first
+    squares = []
+    while bb:
+        lowest = bb & -bb
+        squares.append(lowest.bit_length() - 1)
+        bb ^= lowest
+    return squares
+
+def _build_diff_table(diff):
+    return [[diff(src, dest) for dest in range(64)] for src in range(64)]
+
+# DR[src][dest] / DC[src][dest]: row / column difference from src to dest, and their absolute values
+DR = _build_diff_table(lambda src, dest: (dest >> 3) - (src >> 3))
+DC = _build_diff_table(lambda src, dest: (dest & 7) - (src & 7))
+ABS_DR = _build_diff_table(lambda src, dest: abs((dest >> 3) - (src >> 3)))
+ABS_DC = _build_diff_table(lambda src, dest: abs((dest & 7) - (src & 7)))
+
+def ray_attacks(sq: int, occ: int, d: int) -> int:
+    # Squares attacked along one ray, up to and including the first blocker
+    ray = RAYS[d][sq]
+    blockers = ray & occ
+    if blockers:
+        if RAY_INCREASES[d]:
+            blocker = (blockers & -blockers).bit_length() - 1
+        else:
+            blocker = blockers.bit_length() - 1
+        ray ^= RAYS[d][blocker]
+    return ray
+
+# Magic bitboards for sliding pieces. For each square, the blockers that matter
+# (masked by *_MASKS) are multiplied by a magic constant; the top bits of the
+# product index a table holding the attack set for that blocker layout.
+# The constants were found by a random search and are checked as the tables are built.
+ROOK_MAGICS = [
+    0x2080001440022581, 0x1080200040001080, 0x4080100008200080, 0x0280080080100254,
+    0x4D8004000A180080, 0x0100080400020100, 0x1080010040800200, 0x0200004402002081,
+    0x0068800024884004, 0x1000804000802002, 0x000200208A001040, 0x3008801000800800,
+    0x2006001060440A00, 0x1000800200800400, 0x0004000441024810, 0xA001000082004100,
+    0x0040808000204014, 0x0000424002201000, 0x0010110041002000, 0x0000090021041000,
+    0x0204008004800800, 0x0000808004000200, 0x6006040021485042, 0x0000020002409924,
+    0x2000401980028020, 0x4000400100308100, 0x0000820200201041, 0xB100100080800800,
+    0x3004080080040080, 0x0802000200041009, 0x01A0580400021110, 0x00020042000408A1,
+    0x4218884000800023, 0x0480201000400045, 0x0010200080801000, 0x1200200901001000,
+    0x0000100801000500, 0x0080020080800400, 0x004A000100404080, 0x0480005402001081,
+    0x258000402000C000, 0xA010004820084002, 0x0480200010008080, 0x244100100021000C,
+    0x2040080005010010, 0x0012000810020004, 0x0011000200B9000C, 0x1121000080410002,
+    0x00082080410A0600, 0x4002008100402600, 0x0A0300E008544100, 0x7B00080010008080,
+    0x0300080100100500, 0x0002020080040080, 0x0042521810214400, 0x8A00004089140200,
+    0x00001280010A2041, 0x0400401102042086, 0x41902000100C4101, 0x0043020420900009,
+    0x00E2000410082002, 0x4402000108041002, 0x2100101A00814804, 0x0400010400218246,
+]
+BISHOP_MAGICS = [
+    0x0102040418220020, 0x0108024802002028, 0x8010044040400001, 0x0022209200044800,
+    0x4004504005040114, 0x0022010420A80800, 0x0008441008090002, 0x0000420801480200,
+    0x1100220244011C00, 0x00883004081AB020, 0x4400100152002000, 0x4019080841004000,
+    0x2861021210000000, 0x400EA10108400020, 0x4800208208A24000, 0x0020A500A0842085,
+    0x3410000802504400, 0x0010E0200C010060, 0x0014182042408200, 0x4094006840112109,
+    0x2014200202010000, 0x000100020080C400, 0x800400420D2C0200, 0x0002200182251000,
+    0x0010F10304C41000, 0x001024A008281084, 0x0088110002040100, 0x0820080001004008,
+    0x0104040020410050, 0x0110002027040500, 0x418C008009182100, 0x2C00A9040C80480B,
+    0x008110C8005020A4, 0x4004210802041000, 0x0004020108208100, 0x0000080800120A00,
+    0x430C008400820102, 0x1400808100020108, 0x005006020010A8A0, 0x000801868004A220,
+    0x00420105C00C2000, 0x1010921032019040, 0x0300222028103000, 0x0008004208001080,
+    0x5410202248811400, 0x0008010800800808, 0x3C02C20404000900, 0x0408022282040032,
+    0x0000941002100000, 0x0112209A10100804, 0x080C020111210000, 0x442002A442022008,
+    0x00084A181B040000, 0x00115021021C2080, 0x4010051000A20000, 0x0404688085060000,
+    0x0000220110011000, 0x140000220734200C, 0x0440010424020800, 0x2204828883460800,
+    0x0020000004050410, 0x4060004A20082080, 0x00489034B002C201, 0x0444049010410300,
+]
+
+def _relevant_mask(sq, directions):
+    # Squares on the rays from sq that can block it; the last square of a ray never matters
+    mask = 0
+    for d in directions:
+        dr, dc = DIRECTIONS[d]
+        r, c = sq // 8 + dr, sq % 8 + dc
+        while 0 <= r + dr < 8 and 0 <= c + dc < 8:
+            mask |= 1 << (r * 8 + c)
+            r += dr
+            c += dc
+    return mask
+
+def _build_magic_tables(directions, magics):
+    masks, shifts, tables = [], [], []
+    for sq in range(64):
+        mask = _relevant_mask(sq, directions)
+        shift = 64 - bin(mask).count("1")
+        table = [None] * (1 << (64 - shift))
+        # Enumerate every subset of the mask (carry-rippler trick)
+        occ = 0
+        while True:
+            attacks = 0
+            for d in directions:
+                attacks |= ray_attacks(sq, occ, d)
+            index = ((occ * magics[sq]) & BOARD_MASK) >> shift
+            if table[index] is not None and table[index] != attacks:
+                raise ValueError(f"Bad magic for square {sq}")
+            table[index] = attacks
+            occ = (occ - mask) & mask
+            if occ == 0:
+                break
+        masks.append(mask)
+        shifts.append(shift)
+        tables.append(table)
+    return masks, shifts, tables
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = _build_magic_tables(ORTHOGONAL, ROOK_MAGICS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = _build_magic_tables(DIAGONAL, BISHOP_MAGICS)
+
+def rook_attacks(sq: int, occ: int) -> int:
+    return ROOK_ATTACKS[sq][(((occ & ROOK_MASKS[sq]) * ROOK_MAGICS[sq]) & BOARD_MASK) >> ROOK_SHIFTS[sq]]
+
+def bishop_attacks(sq: int, occ: int) -> int:
+    return BISHOP_ATTACKS[sq][(((occ & BISHOP_MASKS[sq]) * BISHOP_MAGICS[sq]) & BOARD_MASK) >> BISHOP_SHIFTS[sq]]
+
+KNIGHT_OFFSETS = [(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)]
+KING_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+def _build_jump_table(offsets):
+    table = [0] * 64
+    for sq in range(64):
+        row, col = sq // 8, sq % 8
+        for dr, dc in offsets:
+            r, c = row + dr, col + dc
+            if 0 <= r < 8 and 0 <= c < 8:
+                table[sq] |= 1 << (r * 8 + c)
+    return table
+
+# KNIGHT_ATTACKS[sq] / KING_ATTACKS[sq]: every square a knight / king on sq can jump to
+KNIGHT_ATTACKS = _build_jump_table(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_jump_table(KING_OFFSETS)
+
+def _build_pawn_tables(color):
+    attacks = [0] * 64
+    pushes = [0] * 64
+    for sq in range(64):
+        bb = 1 << sq
+        if color == Color.WHITE:
+            attacks[sq] = (((bb & NOT_FILE_A) << 7) | ((bb & NOT_FILE_H) << 9)) & BOARD_MASK
+            pushes[sq] = (bb << 8) & BOARD_MASK
+            if sq >> 3 == 1:
+                pushes[sq] |= bb << 16
+        else:
+            attacks[sq] = ((bb & NOT_FILE_H) >> 7) | ((bb & NOT_FILE_A) >> 9)
+            pushes[sq] = bb >> 8
+            if sq >> 3 == 6:
+                pushes[sq] |= bb >> 16
+    return attacks, pushes
+
+# *_PAWN_ATTACKS[sq]: the squares a pawn on sq captures on
+# *_PAWN_PUSHES[sq]: the squares it can push to, including the double push from its starting row
+WHITE_PAWN_ATTACKS, WHITE_PAWN_PUSHES = _build_pawn_tables(Color.WHITE)
+BLACK_PAWN_ATTACKS, BLACK_PAWN_PUSHES = _build_pawn_tables(Color.BLACK)
+
+import random
+
+# Zobrist keys: ZOBRIST[color][kind][sq] is XORed into a board's hash while that piece
+# stands on sq, so every position maps to a (practically) unique 64-bit int.
+# A fixed seed keeps hashes stable between runs
+_zobrist_rng = random.Random(2024)
+ZOBRIST = {color: [[_zobrist_rng.getrandbits(64) for _ in range(64)] for _ in range(6)] for color in Color}
+
+# Bound on cached is_in_check results; the cache is cleared once it fills up
+CHECK_CACHE_SIZE = 1 << 16
+
+def square_attacked(sq: int, by_white: bool, bb: list[int], occ: int) -> bool:
+    # Whether any piece in the attacker's bitboards (bb, indexed by KIND) attacks sq.
+    # Kept to plain ints and lists: no Board, Piece or Color objects and no exceptions
+
+    # Knights and kings jump, so a single table lookup against their attack set is enough
+    if KNIGHT_ATTACKS[sq] & bb[Knight.KIND]:
+        return True
+    if KING_ATTACKS[sq] & bb[King.KIND]:
+        return True
+
+    # Pawn attacks are symmetric: sq is attacked by the attacker's pawns standing on the
+    # squares that a defending pawn on sq would capture on
+    pawn_squares = BLACK_PAWN_ATTACKS[sq] if by_white else WHITE_PAWN_ATTACKS[sq]
+    if pawn_squares & bb[Pawn.KIND]:
+        return True
+
+    # Sliding pieces: look outward from the square along the lines and diagonals,
+    # skipping a lookup when no enemy piece could use that kind of line
+    queens = bb[Queen.KIND]
+    line_sliders = bb[Rook.KIND] | queens
+    if line_sliders and rook_attacks(sq, occ) & line_sliders:
+        return True
+    diagonal_sliders = bb[Bishop.KIND] | queens
+    if diagonal_sliders and bishop_attacks(sq, occ) & diagonal_sliders:
+        return True
+
+    return False  # No piece can attack the square
+
+# Symbols used by display_board; empty squares print as "."
+SYMBOL = {King: "K", Queen: "Q", Rook: "R", Pawn: "P", Knight: "Kn", Bishop: "B"}
 
 class Board:
-    def __init__(self):
-        self.board = [[None] * 8 for _ in range(8)]
+    def __init__(self) -> None:
+        # Flat mailbox indexed by square (row * 8 + col)
+        self.board: list[Optional[Piece]] = [None] * 64
+        # One bitboard per color and piece KIND plus an occupancy mask per color.
+        # self.board is kept as a facade so get_piece can hand Piece objects to Player
+        self.bb: dict[Color, list[int]] = {color: [0] * 6 for color in Color}
+        self.occ_white: int = 0
+        self.occ_black: int = 0
+        self.zhash: int = 0
+        self.king_pos: dict[Color, tuple[int, int]] = {}
+        # is_in_check results keyed by (zhash, color, king square)
+        self.check_cache: dict[tuple[int, Color, int], bool] = {}
         self._initialize_board()
 
     def _initialize_board(self):
         # Initialize white pieces
-        self.board[0][0] = Rook(Color.WHITE, 0, 0)
-        self.board[0][1] = Knight(Color.WHITE, 0, 1)
-        self.board[0][2] = Bishop(Color.WHITE, 0, 2)
-        self.board[0][3] = Queen(Color.WHITE, 0, 3)
-        self.board[0][4] = King(Color.WHITE, 0, 4)
-        self.board[0][5] = Bishop(Color.WHITE, 0, 5)
-        self.board[0][6] = Knight(Color.WHITE, 0, 6)
-        self.board[0][7] = Rook(Color.WHITE, 0, 7)
+        self.set_piece(0, 0, WHITE_ROOK)
+        self.set_piece(0, 1, WHITE_KNIGHT)
+        self.set_piece(0, 2, WHITE_BISHOP)
+        self.set_piece(0, 3, WHITE_QUEEN)
+        self.set_piece(0, 4, WHITE_KING)
+        self.set_piece(0, 5, WHITE_BISHOP)
+        self.set_piece(0, 6, WHITE_KNIGHT)
+        self.set_piece(0, 7, WHITE_ROOK)
         for i in range(8):
-            self.board[1][i] = Pawn(Color.WHITE, 1, i)
+            self.set_piece(1, i, WHITE_PAWN)
 
         # Initialize black pieces
-        self.board[7][0] = Rook(Color.BLACK, 7, 0)
-        self.board[7][1] = Knight(Color.BLACK, 7, 1)
-        self.board[7][2] = Bishop(Color.BLACK, 7, 2)
-        self.board[7][3] = Queen(Color.BLACK, 7, 3)
-        self.board[7][4] = King(Color.BLACK, 7, 4)
-        self.board[7][5] = Bishop(Color.BLACK, 7, 5)
-        self.board[7][6] = Knight(Color.BLACK, 7, 6)
-        self.board[7][7] = Rook(Color.BLACK, 7, 7)
+        self.set_piece(7, 0, BLACK_ROOK)
+        self.set_piece(7, 1, BLACK_KNIGHT)
+        self.set_piece(7, 2, BLACK_BISHOP)
+        self.set_piece(7, 3, BLACK_QUEEN)
+        self.set_piece(7, 4, BLACK_KING)
+        self.set_piece(7, 5, BLACK_BISHOP)
+        self.set_piece(7, 6, BLACK_KNIGHT)
+        self.set_piece(7, 7, BLACK_ROOK)
         for i in range(8):
-            self.board[6][i] = Pawn(Color.BLACK, 6, i)
-
-    def get_piece(self, row, col):
-        return self.board[row][col]
-
-    def set_piece(self, row, col, piece):
-        self.board[row][col] = piece
-
-    def is_valid_move(self, piece, dest_row, dest_col):
-        if piece is None or dest_row < 0 or dest_row > 7 or dest_col < 0 or dest_col > 7:
+            self.set_piece(6, i, BLACK_PAWN)
+
+        # Cache the king positions so check detection never has to search for them
+        self.king_pos = {Color.WHITE: (0, 4), Color.BLACK: (7, 4)}
+
+    def get_piece(self, row: int, col: int) -> Optional[Piece]:
+        return self.board[(row << 3) | col]
+
+    def set_piece(self, row: int, col: int, piece: Optional[Piece]) -> None:
+        self._set_square((row << 3) | col, piece)
+
+    def _set_square(self, sq: int, piece: Optional[Piece]) -> None:
+        mask = 1 << sq
+        old_piece = self.board[sq]
+        if old_piece is not None:
+            self.zhash ^= ZOBRIST[old_piece.color][old_piece.KIND][sq]
+            self.bb[old_piece.color][old_piece.KIND] &= ~mask
+            if old_piece.color == Color.WHITE:
+                self.occ_white &= ~mask
+            else:
+                self.occ_black &= ~mask
+        self.board[sq] = piece
+        if piece is not None:
+            self.zhash ^= ZOBRIST[piece.color][piece.KIND][sq]
+            self.bb[piece.color][piece.KIND] |= mask
+            if piece.color == Color.WHITE:
+                self.occ_white |= mask
+            else:
+                self.occ_black |= mask
+
+    def occupancy(self, color: Optional[Color] = None) -> int:
+        # Occupied squares of one color, or of both when color is None
+        if color is None:
+            return self.occ_white | self.occ_black
+        return self.occ_white if color == Color.WHITE else self.occ_black
+
+    def is_valid_move(self, source_row: int, source_col: int, dest_row: int, dest_col: int) -> bool:
+        if source_row < 0 or source_row > 7 or source_col < 0 or source_col > 7 or \
+           dest_row < 0 or dest_row > 7 or dest_col < 0 or dest_col > 7:
+            return False
+        source_sq = source_row * 8 + source_col
+        dest_sq = dest_row * 8 + dest_col
+        piece = self.board[source_sq]
+        if piece is None:
             return False
-        dest_piece = self.board[dest_row][dest_col]
+        dest_piece = self.board[dest_sq]
         return (dest_piece is None or dest_piece.color != piece.color) and \
-               piece.can_move(self, dest_row, dest_col)
-
-    def is_in_check(self, color, king_row, king_col):
-        # Directions for sliding pieces (Rook, Bishop, Queen)
-        directions = [
-            (-1, 0),  # Up (Vertical)
-            (1, 0),   # Down (Vertical)
-            (0, -1),  # Left (Horizontal)
-            (0, 1),   # Right (Horizontal)
-            (-1, -1), # Top-left (Diagonal)
-            (-1, 1),  # Top-right (Diagonal)
-            (1, -1),  # Bottom-left (Diagonal)
-            (1, 1),   # Bottom-right (Diagonal)
-        ]
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece.color != color:
-                    # Check if this piece can attack the king's position
-                    if isinstance(piece, Rook) or isinstance(piece, Queen):
-                        if piece.can_move(self, king_row, king_col):
-                            # Check if the path is blocked for rooks/queens (only horizontal/vertical)
-                            if row == king_row or col == king_col:
-                                step_row = (king_row - row) // max(1, abs(king_row - row)) if row != king_row else 0
-                                step_col = (king_col - col) // max(1, abs(king_col - col)) if col != king_col else 0
-                                r, c = row + step_row, col + step_col
-                                while r != king_row or c != king_col:
-                                    if self.get_piece(r, c) is not None:  # A piece is blocking
-                                        break
-                                    r += step_row
-                                    c += step_col
-                                else:
-                                    return True  # No blockage, valid attack path found
-                    if isinstance(piece, Bishop) or isinstance(piece, Queen):
-                        if piece.can_move(self, king_row, king_col):
-                            # Check if the diagonal path is blocked
-                            if abs(row - king_row) == abs(col - king_col):
-                                step_row = (king_row - row) // max(1, abs(king_row - row)) if row != king_row else 0
-                                step_col = (king_col - col) // max(1, abs(king_col - col)) if col != king_col else 0
-                                r, c = row + step_row, col + step_col
-                                while r != king_row or c != king_col:
-                                    if self.get_piece(r, c) is not None:  # A piece is blocking
-                                        break
-                                    r += step_row
-                                    c += step_col
-                                else:
-                                    return True  # No blockage, valid attack path found
-                    if isinstance(piece, Knight):
-                        if piece.can_move(self, king_row, king_col):
-                            return True  # Knights can jump over pieces, so just check if they can attack
-
-                    if isinstance(piece, Pawn):
-                        # Pawns only attack diagonally, so check if the opponent pawn can attack the king
-                        if piece.can_move(self, king_row, king_col):
-                            return True  # Pawn attacks in a specific way
-
-                    if isinstance(piece, King):
-                        if piece.can_move(self, king_row, king_col):
-                            return True  # Check if an opposing king can attack
-
-        return False  # No piece can attack the king
-
+               piece.can_move(self, source_sq, dest_sq)
+
+    def is_in_check(self, color: Color, king_row: int, king_col: int) -> bool:
+        king_sq = king_row * 8 + king_col
+        key = (self.zhash, color, king_sq)
+        in_check = self.check_cache.get(key)
+        if in_check is None:
+            enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+            in_check = square_attacked(king_sq, enemy == Color.WHITE,
+                                       self.bb[enemy], self.occ_white | self.occ_black)
+            if len(self.check_cache) >= CHECK_CACHE_SIZE:
+                self.check_cache.clear()
+            self.check_cache[key] = in_check
+        return in_check
+
+
+    def make_move(self, source_sq: int, dest_sq: int) -> tuple[int, int, Optional[Piece]]:
+        # Move the piece without validating it and return what unmake_move needs to undo it
+        piece = self.board[source_sq]
+        captured = self.board[dest_sq]
+        self._set_square(source_sq, None)
+        self._set_square(dest_sq, piece)
+        if piece is not None and piece.KIND == King.KIND:
+            self.king_pos[piece.color] = divmod(dest_sq, 8)
+        return source_sq, dest_sq, captured
+
+    def unmake_move(self, undo_info: tuple[int, int, Optional[Piece]]) -> None:
+        source_sq, dest_sq, captured = undo_info
+        piece = self.board[dest_sq]
+        self._set_square(dest_sq, captured)
+        self._set_square(source_sq, piece)
+        if piece is not None and piece.KIND == King.KIND:
+            self.king_pos[piece.color] = divmod(source_sq, 8)
 
     def copy_board(self):
-        # Create a new Board instance and copy the pieces to it
-        new_board = Board()
-        new_board.board = copy.deepcopy(self.board)  # Deep copy the board to avoid reference issues
+        # Skip __init__ so no starting position is built only to be overwritten.
+        # Pieces are stateless, so the copy shares them with this board
+        new_board = Board.__new__(Board)
+        new_board.board = self.board[:]
+        new_board.bb = {color: bbs[:] for color, bbs in self.bb.items()}
+        new_board.occ_white = self.occ_white
+        new_board.occ_black = self.occ_black
+        new_board.king_pos = dict(self.king_pos)
+        new_board.zhash = self.zhash
+        # Cached results are keyed by position, so they stay valid on the copy
+        new_board.check_cache = self.check_cache
         return new_board
 
 
-    def is_checkmate(self, color):
-        # Step 1: Find the king of the current color
-        king = None
-        for row in self.board:
-            for piece in row:
-                if isinstance(piece, King) and piece.color == color:
-                    king = piece
-                    break
-            if king:
-                break
+    def is_checkmate(self, color: Color) -> bool:
+        # Step 1: Look up the king of the current color
+        king_row, king_col = self.king_pos[color]
 
         # Step 2: Check if the king is in check
-        if not self.is_in_check(color, king.row, king.col):
+        if not self.is_in_check(color, king_row, king_col):
             return False
         print("King in Check")
         # Step 3: Try all possible moves of the current player to see if any remove the check
@@ -336,56 +649,36 @@ class Board:
 
 
 
-    def is_stalemate(self, color):
-        # Step 1: Find the king of the current color
-        king = None
-        for row in self.board:
-            for piece in row:
-                if isinstance(piece, King) and piece.color == color:
-                    king = piece
-                    break
-            if king:
-                break
+    def is_stalemate(self, color: Color) -> bool:
+        # Step 1: Look up the king of the current color
+        king_row, king_col = self.king_pos[color]
 
         # Step 2: Check if the king is not in check
-        if self.is_in_check(color, king.row, king.col):
+        if self.is_in_check(color, king_row, king_col):
             return False  # If the king is in check, it's not stalemate
 
         # Step 3: Check if the current player has any legal moves
-        for row in range(8):
-            for col in range(8):
-                piece = self.get_piece(row, col)
-                if piece and piece.color == color:
-                    for dest_row in range(8):
-                        for dest_col in range(8):
-                            if self.is_valid_move(piece, dest_row, dest_col):
-                                return False  # Found a legal move
+        for sq in bitboard_squares(self.occupancy(color)):
+            # Every square in the occupancy bitboard holds a piece
+            piece = cast(Piece, self.board[sq])
+            for dest_sq in piece.generate_moves(self, sq):
+                # Try the move in place and keep it only if it leaves the king safe
+                undo_info = self.make_move(sq, dest_sq)
+                king_row, king_col = self.king_pos[color]
+                in_check = self.is_in_check(color, king_row, king_col)
+                self.unmake_move(undo_info)
+                if not in_check:
+                    return False  # Found a legal move
 
         return True  # No legal moves, so it's stalemate
 
 
     def display_board(self):
-      # Iterate through the board and print the pieces in the desired format
-      for row in self.board:
-          row_display = ""
-          for piece in row:
-              if piece is None:
-                  row_display += ". "
-              else:
-                  if isinstance(piece, King):
-                      row_display += "K "
-                  elif isinstance(piece, Queen):
-                      row_display += "Q "
-                  elif isinstance(piece, Rook):
-                      row_display += "R "
-                  elif isinstance(piece, Pawn):
-                      row_display += "P "
-                  elif isinstance(piece, Knight):
-                      row_display += "Kn "
-                  elif isinstance(piece, Bishop):
-                      row_display += "B "
-          print(row_display.strip())  # Remove the trailing space at the end of each row
-      print("\n")  # Add a newline after the board for better readability
+        # Print each row of the board, one symbol per square
+        for r in range(8):
+            row = self.board[r * 8:r * 8 + 8]
+            print(" ".join(SYMBOL.get(type(piece), ".") for piece in row))
+        print("\n")  # Add a newline after the board for better readability
 
 class Game:
     def __init__(self):
@@ -413,12 +706,13 @@ class Game:
             # Switch to the next player
             self.current_player = (self.current_player + 1) % 2
 
-        # Display game result
-        self._display_result()
+        # Display game result for the side that was left without a move
+        self._display_result(self.players[self.current_player].color)
 
     def _is_game_over(self):
-        return self.board.is_checkmate(Color.WHITE) or self.board.is_checkmate(Color.BLACK) or \
-               self.board.is_stalemate(Color.WHITE) or self.board.is_stalemate(Color.BLACK)
+        # Only the side to move can be checkmated or stalemated
+        color = self.players[self.current_player].color
+        return self.board.is_checkmate(color) or self.board.is_stalemate(color)
 
     def _get_player_move(self, player):
         # TODO: Implement logic to get a valid move from the player
@@ -428,19 +722,24 @@ class Game:
         dest_row = int(input("Enter destination row: "))
         dest_col = int(input("Enter destination column: "))
 
+        if not (0 <= source_row < 8 and 0 <= source_col < 8 and 0 <= dest_row < 8 and 0 <= dest_col < 8):
+            raise ValueError("Invalid move!")
+
         piece = self.board.get_piece(source_row, source_col)
         if piece is None or piece.color != player.color:
             raise ValueError("Invalid piece selection!")
 
-        return Move(piece, dest_row, dest_col)
+        return encode_move(source_row * 8 + source_col, dest_row * 8 + dest_col)
 
-    def _display_result(self):
-        if self.board.is_checkmate(Color.WHITE):
+    def _display_result(self, color):
+        # The game is over for color, so being in check means checkmate and otherwise stalemate
+        king_row, king_col = self.board.king_pos[color]
+        if not self.board.is_in_check(color, king_row, king_col):
+            print("The game ends in a stalemate!")
+        elif color == Color.WHITE:
             print("Black wins by checkmate!")
-        elif self.board.is_checkmate(Color.BLACK):
+        else:
             print("White wins by checkmate!")
-        elif self.board.is_stalemate(Color.WHITE) or self.board.is_stalemate(Color.BLACK):
-            print("The game ends in a stalemate!")
 
 class ChessGameDemo:
     @staticmethod